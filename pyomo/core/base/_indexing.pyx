@@ -0,0 +1,79 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+# cython: language_level=3
+
+"""Compiled implementation of flatten_tuple()
+
+This module is only built when Pyomo is installed with Cython (see
+setup.py).  pyomo.core.base.indexed_component falls back on the pure
+Python implementation when it is not available (e.g., under PyPy).
+"""
+
+from cpython.list cimport PyList_AsTuple, PyList_CheckExact
+from cpython.tuple cimport PyTuple_CheckExact
+
+from pyomo.core.expr.numvalue import native_types
+
+cdef object _native_types = native_types
+
+
+cpdef tuple flatten_tuple(object x):
+    """Flatten nested sequences into a single tuple.
+
+    This handles native values and (nested) tuples and lists directly,
+    and defers to the Python implementation in
+    :py:mod:`pyomo.core.base.indexed_component` for anything else.
+
+    Returns
+    -------
+    tuple
+
+    """
+    cdef list ans
+    cdef list iter_stack
+    cdef bint flattened = False
+
+    if PyTuple_CheckExact(x):
+        pass
+    elif PyList_CheckExact(x):
+        x = PyList_AsTuple(x)
+    elif type(x) in _native_types:
+        return (x,)
+    else:
+        return _flatten_tuple_fallback(x)
+
+    ans = []
+    iter_stack = [iter(x)]
+    while iter_stack:
+        for xi in iter_stack[-1]:
+            if type(xi) in _native_types:
+                ans.append(xi)
+            elif PyTuple_CheckExact(xi) or PyList_CheckExact(xi):
+                iter_stack.append(iter(xi))
+                flattened = True
+                break
+            else:
+                return _flatten_tuple_fallback(x)
+        else:
+            iter_stack.pop()
+
+    if not flattened:
+        return x
+    return PyList_AsTuple(ans)
+
+
+cdef tuple _flatten_tuple_fallback(object x):
+    # Deferred import: indexed_component imports this module
+    from pyomo.core.base.indexed_component import normalize_index
+    ans = normalize_index(x)
+    if PyTuple_CheckExact(ans):
+        return ans
+    return (ans,)
@@ -8,8 +8,13 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+# When cythonized, normalize_index must remain a Python function object
+# so that it can carry the "flatten" attribute
+# cython: binding=True
+
 __all__ = ['IndexedComponent', 'ActiveIndexedComponent']
 
+import logging
 import pyutilib.misc
 
 from pyomo.core.expr.expr_errors import TemplateExpressionError
@@ -27,7 +32,29 @@ if PY3:
 else:
     from collections import Sequence as collections_Sequence
 
+logger = logging.getLogger('pyomo.core')
+
 sequence_types = {tuple, list}
+# Map of the (non-native) classes encountered when flattening indices
+# that are not sequences.  This records the result of the (comparatively
+# expensive) issubclass() test against the Sequence ABC.  Sequences are
+# recorded by adding them to sequence_types (and custom string types to
+# native_types), so only the negative results are kept here.
+_sequence_class_map = {}
+
+def _classify_index_class(cls):
+    """Determine (and record) if instances of cls should be flattened"""
+    if issubclass(cls, collections_Sequence):
+        if issubclass(cls, string_types):
+            # This is very difficult to get to: it would require a
+            # user creating a custom derived string type
+            native_types.add(cls)
+            return False
+        sequence_types.add(cls)
+        return True
+    _sequence_class_map[cls] = False
+    return False
+
 def normalize_index(x):
     """Normalize a component index.
 
@@ -52,8 +79,20 @@ def normalize_index(x):
     else:
         x = (x,)
 
-    x_len = len(x)
+    # Most indices are already flat tuples of native values: scan for
+    # that case before doing any work.  Otherwise, resume the flattening
+    # loop below from the first non-native element.
     i = 0
+    for _xi in x:
+        if _xi.__class__ not in native_types:
+            break
+        i += 1
+    else:
+        if i == 1:
+            return x[0]
+        return x
+
+    x_len = len(x)
     while i < x_len:
         _xi_class = x[i].__class__
         if _xi_class in native_types:
@@ -63,24 +102,49 @@ def normalize_index(x):
             # Note that casting a tuple to a tuple is cheap (no copy, no
             # new object)
             x = x[:i] + tuple(x[i]) + x[i + 1:]
-        elif issubclass(_xi_class, collections_Sequence):
-            if issubclass(_xi_class, string_types):
-                # This is very difficult to get to: it would require a
-                # user creating a custom derived string type
-                native_types.add(_xi_class)
-                i += 1
-            else:
-                sequence_types.add(_xi_class)
+        else:
+            # Note: sequence_types is checked first so that classes
+            # registered there after being classified are still flattened
+            if _xi_class not in _sequence_class_map \
+               and _classify_index_class(_xi_class):
                 x_len += len(x[i]) - 1
                 x = x[:i] + tuple(x[i]) + x[i + 1:]
-        else:
-            i += 1
+            else:
+                i += 1
 
     if x_len == 1:
         return x[0]
     return x
 
-# Pyomo will normalize indices by default
+
+def flatten_tuple(x):
+    """Flatten nested sequences into a single tuple.
+
+    This applies the same flattening rules as
+    :py:func:`normalize_index`, except that the result is always a
+    tuple (scalars and single values are returned as 1-tuples).
+
+    Returns
+    -------
+    tuple
+
+    """
+    ans = normalize_index(x)
+    if ans.__class__ is tuple:
+        return ans
+    return (ans,)
+
+try:
+    # Use the compiled flatten_tuple when Pyomo was built with Cython
+    from pyomo.core.base._indexing import flatten_tuple
+except ImportError:
+    pass
+
+# Pyomo will normalize indices by default.  Note that normalize_index()
+# does not consult this flag: callers test it before normalizing.
+# Callers hold direct references to this function (through "from
+# indexed_component import normalize_index"), so the flag must remain an
+# attribute on the function object and the function must not be rebound.
 normalize_index.flatten = True
 
 
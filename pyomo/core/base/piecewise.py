@@ -45,12 +45,11 @@ import operator
 import types
 import enum
 
-from pyutilib.misc import flatten_tuple
-
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.block import Block, _BlockData
 from pyomo.core.base.constraint import Constraint, ConstraintList
+from pyomo.core.base.indexed_component import flatten_tuple
 from pyomo.core.base.sos import SOSConstraint
 from pyomo.core.base.var import Var, _VarData, IndexedVar
 from pyomo.core.base.set_types import PositiveReals, NonNegativeReals, Binary
@@ -184,7 +183,9 @@ def _characterize_function(name, tol, f_rule, model, points, *index):
               "documentation for information on how to disable this warning."
         if index == ():
             index = None
-        print(msg % (name, flatten_tuple(index)))
+        else:
+            index = flatten_tuple(index)
+        print(msg % (name, index))
 
     if step is True:
         return 0,values,True
@@ -8,12 +8,11 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-from pyutilib.misc import flatten_tuple
 from pyomo.common import DeveloperError
 from pyomo.core.base.set import SetOf, _SetDataBase
 from pyomo.core.base.component import Component, ComponentData
 from pyomo.core.base.indexed_component import (
-    IndexedComponent, UnindexedComponent_set
+    IndexedComponent, UnindexedComponent_set, flatten_tuple
 )
 from pyomo.core.base.indexed_component_slice import (
     IndexedComponent_slice, _IndexedComponent_slice_iter
@@ -284,8 +283,6 @@ class _ReferenceDict(collections_MutableMapping):
         return iter(self._slice)
 
     def _get_iter(self, _slice, key, get_if_not_present=False):
-        if key.__class__ not in (tuple, list):
-            key = (key,)
         return _IndexedComponent_slice_iter(
             _slice,
             _fill_in_known_wildcards(flatten_tuple(key),
@@ -338,8 +335,6 @@ class _ReferenceSet(collections_Set):
         return sum(1 for _ in self)
 
     def _get_iter(self, _slice, key):
-        if key.__class__ not in (tuple, list):
-            key = (key,)
         return _IndexedComponent_slice_iter(
             _slice,
             _fill_in_known_wildcards(flatten_tuple(key), look_in_index=True),
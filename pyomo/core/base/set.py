@@ -3574,10 +3574,20 @@ class SetProduct(SetOperator):
         nested tuples (so this only needs to check the top-level terms)
 
         """
-        for i in xrange(len(val)-1, -1, -1):
-            if val[i].__class__ is tuple:
-                val = val[:i] + val[i] + val[i+1:]
-        return val
+        for v in val:
+            if v.__class__ is tuple:
+                break
+        else:
+            return val
+        # Build the flattened value in a single pass (instead of
+        # splicing each nested tuple back into val)
+        ans = []
+        for v in val:
+            if v.__class__ is tuple:
+                ans.extend(v)
+            else:
+                ans.append(v)
+        return tuple(ans)
 
 class SetProduct_InfiniteSet(SetProduct):
     __slots__ = tuple()
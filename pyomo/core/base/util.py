@@ -39,7 +39,7 @@ def is_functor(obj):
     """
     Returns true iff obj.__call__ is defined.
     """
-    return inspect.isfunction(obj) or hasattr(obj,'__call__')
+    return callable(obj)
 
 
 #
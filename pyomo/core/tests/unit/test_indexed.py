@@ -18,7 +18,10 @@ currdir = dirname(abspath(__file__))+os.sep
 import pyutilib.th as unittest
 
 from pyomo.environ import *
-from pyomo.core.base.indexed_component import normalize_index
+import pyomo.core.base.indexed_component as indexed_component
+from pyomo.core.base.indexed_component import (
+    normalize_index, flatten_tuple, collections_Sequence,
+)
 
 class TestSimpleVar(unittest.TestCase):
 
@@ -125,6 +128,94 @@ class TestIndexedComponent(unittest.TestCase):
         self.assertIs(m.j, normalize_index(m.j))
         self.assertIs(m.j[1], normalize_index(m.j[1]))
 
+        # Test that indices that do not need flattening are returned
+        # unchanged
+        idx = (1, m.x, 'a')
+        self.assertIs(idx, normalize_index(idx))
+        self.assertEqual((1, m.x, 2, 'a'), normalize_index((1, (m.x, 2), 'a')))
+
+    def test_flatten_tuple(self):
+        self.assertEqual(("abc",), flatten_tuple("abc"))
+        self.assertEqual((1,), flatten_tuple(1))
+        self.assertEqual((1,), flatten_tuple([1]))
+        self.assertEqual((1,), flatten_tuple(((1,),)))
+        self.assertEqual((1, 2, 3), flatten_tuple((1, 2, 3)))
+        self.assertEqual((1, 2, 3, 4), flatten_tuple((1, 2, [3, 4])))
+        self.assertEqual((1, 2, 3, 4, 5), flatten_tuple(
+            [[], 1, [], 2, [[], 3, [[], 4, []], []], 5, []]))
+        self.assertEqual((), flatten_tuple([[[[], []], []], []]))
+
+        m = ConcreteModel()
+        m.x = Var()
+        self.assertEqual((m.x,), flatten_tuple(m.x))
+        idx = (1, m.x, 'a')
+        self.assertIs(idx, flatten_tuple(idx))
+        self.assertEqual((1, m.x, 2, 'a'), flatten_tuple((1, (m.x, 2), 'a')))
+
+    def test_normalize_index_custom_types(self):
+        class _seq(object):
+            def __init__(self, *args):
+                self._data = args
+            def __getitem__(self, i):
+                return self._data[i]
+            def __len__(self):
+                return len(self._data)
+        collections_Sequence.register(_seq)
+
+        class _str(str):
+            pass
+
+        class _obj(object):
+            pass
+
+        self.addCleanup(indexed_component.sequence_types.discard, _seq)
+        self.addCleanup(indexed_component.native_types.discard, _str)
+        self.addCleanup(
+            indexed_component._sequence_class_map.pop, _seq, None)
+        self.addCleanup(
+            indexed_component._sequence_class_map.pop, _str, None)
+        self.addCleanup(
+            indexed_component._sequence_class_map.pop, _obj, None)
+
+        a = _obj()
+        self.assertEqual((1, 2, 3), normalize_index((1, _seq(2, 3))))
+        self.assertIn(_seq, indexed_component.sequence_types)
+        self.assertEqual((1, _str('a')), normalize_index((1, (_str('a'),))))
+        self.assertIn(_str, indexed_component.native_types)
+        self.assertEqual((1, 2, a), normalize_index((1, (2, a))))
+        self.assertIs(indexed_component._sequence_class_map[_obj], False)
+        # Only non-sequences are recorded in the class map
+        self.assertNotIn(_seq, indexed_component._sequence_class_map)
+        self.assertNotIn(_str, indexed_component._sequence_class_map)
+
+        # Registering a class in sequence_types after it has been seen
+        # (and classified as a non-sequence) must still take effect
+        class _seq2(_obj):
+            def __init__(self, *args):
+                self._data = args
+            def __iter__(self):
+                return iter(self._data)
+            def __len__(self):
+                return len(self._data)
+        self.addCleanup(indexed_component.sequence_types.discard, _seq2)
+        self.addCleanup(
+            indexed_component._sequence_class_map.pop, _seq2, None)
+        o = _seq2(2, 3)
+        self.assertEqual((1, 0, o), normalize_index((1, (0, o))))
+        indexed_component.sequence_types.add(_seq2)
+        self.assertEqual((1, 0, 2, 3), normalize_index((1, (0, o))))
+        self.assertEqual((1, 2, 3), normalize_index((1, o)))
+        self.assertEqual((1, 2, a), normalize_index((1, (2, a))))
+        # ... and removing it again must also take effect
+        indexed_component.sequence_types.discard(_seq2)
+        self.assertEqual((1, o), normalize_index((1, o)))
+
+    def test_normalize_index_preserves_types(self):
+        # Equal values of different types must normalize independently
+        self.assertIs(normalize_index((True, (2, 3)))[0].__class__, bool)
+        self.assertIs(normalize_index((1, (2, 3)))[0].__class__, int)
+        self.assertIs(normalize_index((1.0, (2, 3)))[0].__class__, float)
+
     def test_index_by_constant_simpleComponent(self):
         m = ConcreteModel()
         m.i = Param(initialize=2)
@@ -611,6 +611,23 @@ class TestReference(unittest.TestCase):
         self.assertIs(type(base_sets[0]), UnorderedSetOf)
         self.assertIs(type(base_sets[1]), UnorderedSetOf)
 
+    def test_nested_sequence_index(self):
+        # Lookup keys are flattened through lists as well as tuples
+        m = ConcreteModel()
+        m.x = Var([1,2], [3,4])
+        m.r = Reference(m.x[:,:])
+        self.assertIs(m.r[(1,[3])], m.x[1,3])
+        self.assertIs(m.r[([1],3)], m.x[1,3])
+        self.assertIs(m.r[[2,(4,)]], m.x[2,4])
+
+        rd = _ReferenceDict(m.x[:,:])
+        self.assertIn((1,[3]), rd)
+        self.assertIs(rd[([1],3)], m.x[1,3])
+
+        rs = _ReferenceSet(m.x[:,:])
+        self.assertIn(([1],3), rs)
+        self.assertNotIn(([1],5), rs)
+
     def test_ctype_detection(self):
         m = ConcreteModel()
         m.js = Set(initialize=[1, (2,3)], dimen=None)
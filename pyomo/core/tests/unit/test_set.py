@@ -2973,6 +2973,12 @@ J : Size=1, Index=None, Ordered=False
         self.assertNotIn(('a',2), x)
         self.assertNotIn((2,'a'), x)
 
+        x = PositiveIntegers * (SetOf([2,3]) * PositiveIntegers)
+        self.assertFalse(x.isfinite())
+        self.assertEqual(x.get((1,2,3)), (1,2,3))
+        self.assertEqual(x.get((1,(2,3))), (1,2,3))
+        self.assertIsNone(x.get((1,4,3)))
+
     def _verify_finite_product(self, a, b):
         if isinstance(a, (Set, SetOf, RangeSet)):
             a_ordered = a.isordered()
@@ -68,6 +68,8 @@ if using_cython:
             "pyomo/core/expr/numeric_expr.pyx",
             "pyomo/core/expr/logical_expr.pyx",
             #"pyomo/core/expr/visitor.pyx",
+            "pyomo/core/base/indexed_component.pyx",
+            "pyomo/core/base/_indexing.pyx",
             "pyomo/core/util.pyx",
             "pyomo/repn/standard_repn.pyx",
             "pyomo/repn/plugins/cpxlp.pyx",
@@ -75,9 +77,32 @@ if using_cython:
             "pyomo/repn/plugins/baron_writer.pyx",
             "pyomo/repn/plugins/ampl/ampl_.pyx",
         ]
-        for f in files:
-            shutil.copyfile(f[:-1], f)
-        ext_modules = cythonize(files, compiler_directives={
+        for f in list(files):
+            # Modules without a .py source are native Cython modules
+            # (these are shipped in the sdist through MANIFEST.in).  Skip
+            # any that are missing rather than letting cythonize() fail
+            # (and disable all the other modules).  Otherwise, only
+            # refresh the .pyx when the .py source has changed so that
+            # cythonize() can skip modules that are up to date
+            if not os.path.exists(f[:-1]):
+                if not os.path.exists(f):
+                    files.remove(f)
+                continue
+            if not os.path.exists(f) \
+               or os.path.getmtime(f[:-1]) > os.path.getmtime(f):
+                shutil.copyfile(f[:-1], f)
+        # Cythonize the (independent) modules in parallel.  This relies
+        # on multiprocessing forking the workers: with the "spawn" or
+        # "forkserver" start methods the workers would re-execute this
+        # script.  (Python 2 has no get_start_method(); it only forks
+        # off Windows.)
+        import multiprocessing
+        nthreads = 0
+        if getattr(multiprocessing, 'get_start_method',
+                   lambda: 'spawn' if sys.platform == 'win32' else 'fork'
+                   )() == 'fork':
+            nthreads = min(multiprocessing.cpu_count(), len(files))
+        ext_modules = cythonize(files, nthreads=nthreads, compiler_directives={
             "language_level": 3 if sys.version_info >= (3, ) else 2})
     except:
         if using_cython == CYTHON_REQUIRED:
@@ -134,7 +159,7 @@ def run_setup():
           'ply',
           'six>=1.4',
       ],
-      packages=find_packages(exclude=("scripts",)),
+      packages=find_packages(include=("pyomo", "pyomo.*")),
       package_data={"pyomo.contrib.viewer":["*.ui"]},
       ext_modules = ext_modules,
       entry_points="""